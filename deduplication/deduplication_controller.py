@@ -5,19 +5,20 @@ Takes structured insight and returns boolean indicating if it's a duplicate.
 
 from . import similarity_checker, supabase_lookup
 
-def check_for_duplicates(new_insight):
+def check_for_duplicates(new_insight, client=None):
     """
     Main function to check if new insight is a duplicate.
     
     Args:
         new_insight (dict): New structured insight to check
+        client: Supabase client to reuse for lookups (optional)
     
     Returns:
         bool: True if insight is duplicate, False if unique
     """
     try:
         # Get relevant existing insights for comparison
-        existing_insights = supabase_lookup.get_relevant_insights_for_comparison(new_insight)
+        existing_insights = supabase_lookup.get_relevant_insights_for_comparison(new_insight, client=client)
         
         if not existing_insights:
             return False  # No existing insights to compare against
@@ -38,12 +39,13 @@ def check_for_duplicates(new_insight):
         # In case of error, assume not duplicate to avoid losing potentially unique insights
         return False
 
-def batch_check_duplicates(new_insights):
+def batch_check_duplicates(new_insights, client=None):
     """
     Check multiple insights for duplicates in batch.
     
     Args:
         new_insights (list): List of new structured insights
+        client: Supabase client to reuse for lookups (optional)
     
     Returns:
         list: List of unique insights (duplicates removed)
@@ -51,7 +53,7 @@ def batch_check_duplicates(new_insights):
     unique_insights = []
     
     for insight in new_insights:
-        if not check_for_duplicates(insight):
+        if not check_for_duplicates(insight, client=client):
             unique_insights.append(insight)
         else:
             print(f"Skipping duplicate insight: {insight.get('insight', 'Unknown')[:50]}...")
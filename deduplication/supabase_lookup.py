@@ -7,7 +7,7 @@ from supabase_storage.supabase_client import get_supabase_admin_client
 import re
 from collections import Counter
 
-def fetch_existing_insights(limit=1000):
+def fetch_existing_insights(limit=1000, client=None):
     """
     Fetch existing insights from Supabase for comparison.
     Note: With the new schema, insights don't have status directly - 
@@ -15,12 +15,13 @@ def fetch_existing_insights(limit=1000):
     
     Args:
         limit (int): Maximum number of insights to fetch
+        client: Supabase client to reuse (optional, admin client if not provided)
     
     Returns:
         list: List of existing insights from database
     """
     try:
-        client = get_supabase_admin_client()
+        client = client or get_supabase_admin_client()
         result = client.table('insights').select('*').limit(limit).execute()
         
         if result.data:
@@ -32,13 +33,14 @@ def fetch_existing_insights(limit=1000):
         print(f"Error fetching existing insights: {e}")
         return []
 
-def fetch_insights_by_keywords(keywords, limit=100):
+def fetch_insights_by_keywords(keywords, limit=100, client=None):
     """
     Fetch insights containing specific keywords for targeted comparison.
     
     Args:
         keywords (list): List of keywords to search for
         limit (int): Maximum number of insights to fetch
+        client: Supabase client to reuse (optional, admin client if not provided)
     
     Returns:
         list: List of matching insights from database
@@ -47,7 +49,7 @@ def fetch_insights_by_keywords(keywords, limit=100):
         return []
     
     try:
-        client = get_supabase_admin_client()
+        client = client or get_supabase_admin_client()
         
         # Create search query using PostgreSQL full-text search
         search_terms = ' | '.join(keywords)  # OR search for any keyword
@@ -65,7 +67,7 @@ def fetch_insights_by_keywords(keywords, limit=100):
         print(f"Error fetching insights by keywords: {e}")
         # Fallback to simple text matching
         try:
-            client = get_supabase_admin_client()
+            client = client or get_supabase_admin_client()
             all_insights = client.table('insights').select('*').limit(limit * 2).execute()
             
             if all_insights.data:
@@ -83,19 +85,20 @@ def fetch_insights_by_keywords(keywords, limit=100):
             print(f"Fallback keyword search also failed: {e2}")
             return []
 
-def fetch_recent_insights(days=30, limit=500):
+def fetch_recent_insights(days=30, limit=500, client=None):
     """
     Fetch recently created insights for comparison.
     
     Args:
         days (int): Number of days back to fetch
         limit (int): Maximum number of insights to fetch
+        client: Supabase client to reuse (optional, admin client if not provided)
     
     Returns:
         list: List of recent insights from database
     """
     try:
-        client = get_supabase_admin_client()
+        client = client or get_supabase_admin_client()
         
         # Since we removed created_at, just fetch the most recent insights by ID
         result = client.table('insights').select('*').order('id', desc=True).limit(limit).execute()
@@ -200,6 +203,9 @@ def get_insight_status_summary(insight_id):
     """
     Get a summary of status across all products and regions for a specific insight.
     
+    The breakdown is built in Postgres by the `get_insight_status_summary()` RPC
+    (see supabase_storage/schema_reference.md).
+    
     Args:
         insight_id (str): UUID of the insight
     
@@ -209,19 +215,10 @@ def get_insight_status_summary(insight_id):
     try:
         client = get_supabase_admin_client()
         
-        result = client.table('status').select('*').eq('insight_id', insight_id).execute()
+        result = client.rpc('get_insight_status_summary', {'p_insight_id': insight_id}).execute()
         
         if result.data:
-            status_counts = {}
-            for record in result.data:
-                status = record['status']
-                status_counts[status] = status_counts.get(status, 0) + 1
-            
-            return {
-                'total_combinations': len(result.data),
-                'status_breakdown': status_counts,
-                'records': result.data
-            }
+            return result.data
         else:
             return {'total_combinations': 0, 'status_breakdown': {}, 'records': []}
             
@@ -229,12 +226,13 @@ def get_insight_status_summary(insight_id):
         print(f"Error getting insight status summary: {e}")
         return {'total_combinations': 0, 'status_breakdown': {}, 'records': []}
 
-def get_relevant_insights_for_comparison(new_insight):
+def get_relevant_insights_for_comparison(new_insight, client=None):
     """
     Get most relevant existing insights for comparison with new insight.
     
     Args:
         new_insight (dict): New insight to find matches for
+        client: Supabase client to reuse (optional, admin client if not provided)
     
     Returns:
         list: List of relevant existing insights
@@ -244,9 +242,9 @@ def get_relevant_insights_for_comparison(new_insight):
     
     # Fetch targeted insights based on keywords
     if keywords:
-        relevant_insights = fetch_insights_by_keywords(keywords)
+        relevant_insights = fetch_insights_by_keywords(keywords, client=client)
     else:
         # Fallback to recent insights
-        relevant_insights = fetch_recent_insights()
+        relevant_insights = fetch_recent_insights(client=client)
     
     return relevant_insights
\ No newline at end of file
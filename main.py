@@ -32,6 +32,9 @@ def run_pipeline(sources_config):
     }
     
     try:
+        # One admin client shared by deduplication lookups and storage
+        supabase_admin_client = get_supabase_admin_client()
+        
         # Step 1: Data Collection
         print("Step 1: Collecting data from sources...")
         raw_content = collect_and_process_data(sources_config)
@@ -64,7 +67,7 @@ def run_pipeline(sources_config):
         
         # Step 4: Deduplication
         print("Step 4: Checking for duplicates...")
-        unique_insights = batch_check_duplicates(structured_insights)
+        unique_insights = batch_check_duplicates(structured_insights, client=supabase_admin_client)
         results['unique_insights_count'] = len(unique_insights)
         print(f"Unique insights: {results['unique_insights_count']} insights")
         
@@ -74,7 +77,6 @@ def run_pipeline(sources_config):
         
         # Step 5: Storage
         print("Step 5: Storing insights in Supabase...")
-        supabase_admin_client = get_supabase_admin_client()
         successful_inserts, failed_inserts = batch_insert_insights(supabase_admin_client, unique_insights)
         results['stored_insights_count'] = len(successful_inserts)
         
@@ -0,0 +1,49 @@
+"""
+Dump Reference Data
+Writes the products/regions snapshot served by the web frontend's /api/products and /api/regions.
+Run before deploying: python scripts/dump_reference.py
+"""
+
+import os
+import sys
+import json
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from supabase_storage.schema_manager import get_all_products, get_all_regions
+
+SNAPSHOT_PATH = os.path.join(project_root, 'web_frontend', 'static', 'reference.json')
+
+def dump_reference(path=SNAPSHOT_PATH):
+    """
+    Query products and regions once and write them to the snapshot file.
+    
+    Args:
+        path (str): Snapshot file to write
+    
+    Returns:
+        bool: True if the snapshot was written
+    """
+    snapshot = {
+        'products': [p['name'] for p in get_all_products()],
+        'regions': [r['code'] for r in get_all_regions()]
+    }
+    
+    if not snapshot['products'] or not snapshot['regions']:
+        print("No products or regions returned; keeping the existing snapshot")
+        return False
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, indent=2)
+    os.replace(tmp_path, path)
+    
+    print(f"Wrote {len(snapshot['products'])} products and {len(snapshot['regions'])} regions to {path}")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if dump_reference() else 1)
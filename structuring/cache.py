@@ -0,0 +1,119 @@
+"""
+Structuring Cache Module
+On-disk cache of LLM responses so identical structuring prompts are not re-sent.
+"""
+
+import os
+import json
+import hashlib
+import inspect
+from functools import wraps
+from utils.config import Config
+
+# Cache hit/miss counters for the current process
+cache_stats = {'hits': 0, 'misses': 0}
+
+def cache_key(request):
+    """
+    Build a deterministic cache key for an LLM request.
+    
+    Args:
+        request (dict): Exact keyword arguments passed to chat.completions.create
+    
+    Returns:
+        str: SHA-256 hex digest of the request
+    """
+    payload = json.dumps(request, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _cache_path(key):
+    return os.path.join(Config.LLM_CACHE_DIR, f"{key}.json")
+
+def get_cached_response(key):
+    """
+    Look up a cached LLM response.
+    
+    Args:
+        key (str): Cache key from cache_key()
+    
+    Returns:
+        str: Cached raw LLM response, or None on a miss
+    """
+    try:
+        with open(_cache_path(key), 'r', encoding='utf-8') as f:
+            response = json.load(f)['response']
+        cache_stats['hits'] += 1
+        return response
+    except (OSError, ValueError, KeyError):
+        cache_stats['misses'] += 1
+        return None
+
+def store_response(key, response):
+    """
+    Store a raw LLM response in the cache.
+    
+    Args:
+        key (str): Cache key from cache_key()
+        response (str): Raw LLM response
+    """
+    try:
+        os.makedirs(Config.LLM_CACHE_DIR, exist_ok=True)
+        path = _cache_path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'response': response}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Error writing LLM cache entry: {e}")
+
+def cached_llm_response(build_request, validate=bool):
+    """
+    Decorator caching a prompt -> raw response LLM call on disk.
+    Works for both sync and async functions. Only responses accepted by
+    validate are stored or served, so a malformed reply is retried rather
+    than cached for good. Disabled unless Config.LLM_CACHE_ENABLED is set.
+    
+    Args:
+        build_request (function): Maps a prompt to the chat.completions.create
+            kwargs the wrapped function sends; the cache key hashes its result
+        validate (function): Returns True for raw responses worth caching
+    
+    Returns:
+        function: Decorator for functions taking the prompt as first argument
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(prompt, *args, **kwargs):
+                if not Config.LLM_CACHE_ENABLED:
+                    return await func(prompt, *args, **kwargs)
+                
+                key = cache_key(build_request(prompt))
+                cached = get_cached_response(key)
+                if cached is not None and validate(cached):
+                    return cached
+                
+                response = await func(prompt, *args, **kwargs)
+                if response and validate(response):
+                    store_response(key, response)
+                return response
+            
+            return async_wrapper
+        
+        @wraps(func)
+        def wrapper(prompt, *args, **kwargs):
+            if not Config.LLM_CACHE_ENABLED:
+                return func(prompt, *args, **kwargs)
+            
+            key = cache_key(build_request(prompt))
+            cached = get_cached_response(key)
+            if cached is not None and validate(cached):
+                return cached
+            
+            response = func(prompt, *args, **kwargs)
+            if response and validate(response):
+                store_response(key, response)
+            return response
+        
+        return wrapper
+    return decorator
@@ -6,6 +6,7 @@ Prepares LLM prompts and parses output into structured fields.
 import json
 import openai
 from utils.config import Config
+from .cache import cached_llm_response
 
 def create_structuring_prompt(cleaned_text):
     """
@@ -46,6 +47,49 @@ def create_structuring_prompt(cleaned_text):
     
     return prompt_template.format(content=cleaned_text)
 
+def _load_llm_json(llm_response):
+    """
+    Strip markdown fences from a raw LLM response and decode its JSON.
+    
+    Args:
+        llm_response (str): Raw response from LLM
+    
+    Returns:
+        Decoded JSON value
+    
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON
+    """
+    # Clean the response - remove any markdown formatting or extra text
+    cleaned_response = llm_response.strip()
+    
+    # Find JSON content if wrapped in markdown
+    if "```json" in cleaned_response:
+        start = cleaned_response.find("```json") + 7
+        end = cleaned_response.find("```", start)
+        cleaned_response = cleaned_response[start:end].strip()
+    elif "```" in cleaned_response:
+        start = cleaned_response.find("```") + 3
+        end = cleaned_response.find("```", start)
+        cleaned_response = cleaned_response[start:end].strip()
+    
+    return json.loads(cleaned_response)
+
+def is_parseable_llm_response(llm_response):
+    """
+    Check whether a raw LLM response parses into an insight object.
+    
+    Args:
+        llm_response (str): Raw response from LLM
+    
+    Returns:
+        bool: True if parse_llm_response would accept it
+    """
+    try:
+        return isinstance(_load_llm_json(llm_response), dict)
+    except (ValueError, AttributeError):
+        return False
+
 def parse_llm_response(llm_response):
     """
     Parse LLM response into structured insight fields.
@@ -57,21 +101,7 @@ def parse_llm_response(llm_response):
         dict: Structured insight data
     """
     try:
-        # Clean the response - remove any markdown formatting or extra text
-        cleaned_response = llm_response.strip()
-        
-        # Find JSON content if wrapped in markdown
-        if "```json" in cleaned_response:
-            start = cleaned_response.find("```json") + 7
-            end = cleaned_response.find("```", start)
-            cleaned_response = cleaned_response[start:end].strip()
-        elif "```" in cleaned_response:
-            start = cleaned_response.find("```") + 3
-            end = cleaned_response.find("```", start)
-            cleaned_response = cleaned_response[start:end].strip()
-        
-        # Parse JSON
-        parsed_data = json.loads(cleaned_response)
+        parsed_data = _load_llm_json(llm_response)
         
         # Ensure results is properly formatted as JSON string for database
         if isinstance(parsed_data.get('results'), dict):
@@ -87,6 +117,44 @@ def parse_llm_response(llm_response):
         print(f"Error parsing LLM response: {e}")
         return None
 
+LLM_MODEL = "gpt-5-nano"
+LLM_TEMPERATURE = 1
+LLM_MAX_TOKENS = 1000
+SYSTEM_PROMPT = "You are an expert at analyzing marketing content and extracting structured insights for ad creative purposes. Always respond with valid JSON only."
+
+def build_llm_messages(prompt):
+    """
+    Build the chat messages sent to the LLM for a structuring prompt.
+    
+    Args:
+        prompt (str): Formatted prompt for LLM
+    
+    Returns:
+        list: Chat completion messages
+    """
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+def build_llm_request(prompt):
+    """
+    Build the chat completion arguments for a structuring prompt.
+    
+    Args:
+        prompt (str): Formatted prompt for LLM
+    
+    Returns:
+        dict: Keyword arguments for chat.completions.create
+    """
+    return {
+        "model": LLM_MODEL,
+        "messages": build_llm_messages(prompt),
+        "temperature": LLM_TEMPERATURE,
+        "max_tokens": LLM_MAX_TOKENS
+    }
+
+@cached_llm_response(build_llm_request, validate=is_parseable_llm_response)
 def call_llm_api(prompt):
     """
     Make API call to LLM service.
@@ -104,15 +172,33 @@ def call_llm_api(prompt):
         
         client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
         
-        response = client.chat.completions.create(
-            model="gpt-5-nano",
-            messages=[
-                {"role": "system", "content": "You are an expert at analyzing marketing content and extracting structured insights for ad creative purposes. Always respond with valid JSON only."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=1,
-            max_tokens=1000
-        )
+        response = client.chat.completions.create(**build_llm_request(prompt))
+        
+        return response.choices[0].message.content
+        
+    except Exception as e:
+        print(f"Error calling OpenAI API: {e}")
+        return None
+
+@cached_llm_response(build_llm_request, validate=is_parseable_llm_response)
+async def call_llm_api_async(prompt, client=None):
+    """
+    Make an async API call to LLM service.
+    
+    Args:
+        prompt (str): Formatted prompt for LLM
+        client (openai.AsyncOpenAI): Client to reuse across calls (optional)
+    
+    Returns:
+        str: Raw LLM response
+    """
+    try:
+        if client is None:
+            if not Config.OPENAI_API_KEY:
+                raise ValueError("OpenAI API key not configured")
+            client = openai.AsyncOpenAI(api_key=Config.OPENAI_API_KEY)
+        
+        response = await client.chat.completions.create(**build_llm_request(prompt))
         
         return response.choices[0].message.content
         
@@ -134,4 +220,21 @@ def format_insight(cleaned_text):
     llm_response = call_llm_api(prompt)
     structured_insight = parse_llm_response(llm_response)
     
+    return structured_insight
+
+async def format_insight_async(cleaned_text, client=None):
+    """
+    Async version of format_insight for running many texts concurrently.
+    
+    Args:
+        cleaned_text (str): Clean text ready for structuring
+        client (openai.AsyncOpenAI): Client to reuse across calls (optional)
+    
+    Returns:
+        dict: Structured insight ready for validation
+    """
+    prompt = create_structuring_prompt(cleaned_text)
+    llm_response = await call_llm_api_async(prompt, client)
+    structured_insight = parse_llm_response(llm_response)
+    
     return structured_insight
\ No newline at end of file
@@ -3,8 +3,14 @@ Structuring Controller
 Connects cleaning module output to structured insight objects.
 """
 
+import asyncio
+import openai
+from utils.config import Config
 from . import insight_formatter, insight_schema
 
+# Maximum number of LLM requests in flight at once
+MAX_CONCURRENT_LLM_CALLS = 10
+
 def process_cleaned_content(cleaned_content_list):
     """
     Process list of cleaned content into structured insights.
@@ -15,19 +21,55 @@ def process_cleaned_content(cleaned_content_list):
     Returns:
         list: List of validated structured insights
     """
-    structured_insights = []
+    results = structure_batch_content(cleaned_content_list)
+    
+    return [insight for insight in results if insight]
+
+def structure_batch_content(texts, max_concurrency=MAX_CONCURRENT_LLM_CALLS):
+    """
+    Structure a batch of cleaned texts with concurrent LLM calls.
+    
+    Args:
+        texts (list): List of cleaned text content
+        max_concurrency (int): Maximum number of LLM requests in flight
+    
+    Returns:
+        list: Structured insight (or None if invalid) for each input text, in order
+    """
+    if not texts:
+        return []
+    
+    return asyncio.run(structure_batch_content_async(texts, max_concurrency))
+
+async def structure_batch_content_async(texts, max_concurrency=MAX_CONCURRENT_LLM_CALLS):
+    """
+    Async version of structure_batch_content for callers already in an event loop.
+    
+    Args:
+        texts (list): List of cleaned text content
+        max_concurrency (int): Maximum number of LLM requests in flight
+    
+    Returns:
+        list: Structured insight (or None if invalid) for each input text, in order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def structure_with_limit(cleaned_text, client):
+        async with semaphore:
+            try:
+                return await structure_single_content_async(cleaned_text, client)
+            except Exception as e:
+                # Log error and continue processing
+                print(f"Error structuring content: {e}")
+                return None
     
-    for cleaned_text in cleaned_content_list:
-        try:
-            insight = structure_single_content(cleaned_text)
-            if insight:
-                structured_insights.append(insight)
-        except Exception as e:
-            # Log error and continue processing
-            print(f"Error structuring content: {e}")
-            continue
+    if not Config.OPENAI_API_KEY:
+        # Each call reports the missing key itself
+        return await asyncio.gather(*(structure_with_limit(t, None) for t in texts))
     
-    return structured_insights
+    # Close the shared client with the batch so its connections don't outlive the event loop
+    async with openai.AsyncOpenAI(api_key=Config.OPENAI_API_KEY) as client:
+        return await asyncio.gather(*(structure_with_limit(t, client) for t in texts))
 
 def structure_single_content(cleaned_text):
     """
@@ -45,6 +87,37 @@ def structure_single_content(cleaned_text):
     # Format using LLM
     raw_insight = insight_formatter.format_insight(cleaned_text)
     
+    return _sanitize_and_validate(raw_insight)
+
+async def structure_single_content_async(cleaned_text, client=None):
+    """
+    Async version of structure_single_content.
+    
+    Args:
+        cleaned_text (str): Single piece of cleaned text
+        client (openai.AsyncOpenAI): Client to reuse across calls (optional)
+    
+    Returns:
+        dict: Validated structured insight or None if invalid
+    """
+    if not cleaned_text or len(cleaned_text.strip()) < 50:
+        return None
+    
+    # Format using LLM
+    raw_insight = await insight_formatter.format_insight_async(cleaned_text, client)
+    
+    return _sanitize_and_validate(raw_insight)
+
+def _sanitize_and_validate(raw_insight):
+    """
+    Sanitize raw LLM output and validate it against the insight schema.
+    
+    Args:
+        raw_insight (dict): Parsed LLM output
+    
+    Returns:
+        dict: Validated structured insight or None if invalid
+    """
     if not raw_insight:
         return None
     
@@ -58,4 +131,4 @@ def structure_single_content(cleaned_text):
         print(f"Invalid insight structure: {errors}")
         return None
     
-    return sanitized_insight
\ No newline at end of file
+    return sanitized_insight
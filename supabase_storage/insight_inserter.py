@@ -5,6 +5,7 @@ Handles creation of UUIDs and insertion into Supabase.
 
 import uuid
 from datetime import datetime, timezone
+from utils.helpers import chunk_list
 
 def generate_insight_id():
     """
@@ -66,14 +67,16 @@ def insert_single_insight(supabase_client, structured_insight):
 
 
 
-def batch_insert_insights(supabase_client, structured_insights):
+def batch_insert_insights(supabase_client, structured_insights, max_batch_size=500):
     """
     Insert multiple insights into Supabase in batch.
     Only inserts into the insights table - status records are created separately when insights are tested.
+    Each chunk of up to max_batch_size records is sent as a single bulk insert request.
     
     Args:
         supabase_client: Supabase client instance
         structured_insights (list): List of validated structured insights
+        max_batch_size (int): Maximum number of records per insert request
     
     Returns:
         tuple: (successful_inserts: list, failed_inserts: list)
@@ -81,33 +84,37 @@ def batch_insert_insights(supabase_client, structured_insights):
     successful_inserts = []
     failed_inserts = []
     
-    # Prepare all records for batch insert
-    db_records = []
+    # Prepare all records for batch insert, keeping the source insight for failure reporting
+    prepared = []
     for insight in structured_insights:
         try:
             db_record = prepare_insight_for_storage(insight)
-            db_records.append(db_record)
+            prepared.append((insight, db_record))
         except Exception as e:
             print(f"Error preparing insight for storage: {e}")
             failed_inserts.append(insight)
     
     # Batch insert into insights table only
-    if db_records:
+    for chunk in chunk_list(prepared, max_batch_size):
+        source_insights = [insight for insight, _ in chunk]
+        db_records = [db_record for _, db_record in chunk]
+        
         try:
             result = supabase_client.table('insights').insert(db_records).execute()
             
             if result.data:
-                successful_inserts = result.data
-                print(f"Successfully inserted {len(successful_inserts)} insights into insights table")
-                print("Note: Status records will be created when insights are moved to testing")
-                    
+                successful_inserts.extend(result.data)
+                print(f"Successfully inserted {len(result.data)} insights into insights table")
             else:
                 print("Batch insert failed - no data returned")
-                failed_inserts.extend(structured_insights)
+                failed_inserts.extend(source_insights)
                 
         except Exception as e:
             print(f"Error during batch insert: {e}")
-            failed_inserts.extend(structured_insights)
+            failed_inserts.extend(source_insights)
+    
+    if successful_inserts:
+        print("Note: Status records will be created when insights are moved to testing")
     
     return successful_inserts, failed_inserts
 
@@ -135,7 +142,8 @@ def move_insight_to_testing(supabase_client, insight_id, product_name, region_co
             return False
         
         # Check if status record already exists
-        existing_status = supabase_client.table('status').select('*').eq('insight_id', insight_id).eq('product_name', product_name).eq('region_code', region_code).execute()
+        # Only existence matters; selecting a key column lets the primary key index answer it
+        existing_status = supabase_client.table('status').select('insight_id').eq('insight_id', insight_id).eq('product_name', product_name).eq('region_code', region_code).limit(1).execute()
         
         if existing_status.data:
             # Update existing record
@@ -5,11 +5,41 @@ Utilities for managing the normalized database schema.
 
 import sys
 import os
+import asyncio
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from supabase_storage.supabase_client import get_supabase_admin_client
+from supabase_storage.supabase_client import get_supabase_admin_client, get_supabase_admin_async_client
+from utils.logger import setup_logger
 from datetime import datetime, timezone
 
+logger = setup_logger("schema_manager")
+
+# Reference data seeded by initialize_reference_tables
+_PRODUCTS = tuple({'name': name} for name in (
+    'Facebook Ads',
+    'Google Ads',
+    'TikTok Ads',
+    'LinkedIn Ads',
+    'Twitter Ads',
+    'Snapchat Ads',
+    'Pinterest Ads',
+    'YouTube Ads'
+))
+
+_REGIONS = tuple({'code': code} for code in (
+    'US',
+    'EU',
+    'APAC',
+    'LATAM',
+    'MENA',
+    'CA',
+    'UK',
+    'AU'
+))
+
+PRODUCT_NAMES = frozenset(p['name'] for p in _PRODUCTS)
+REGION_CODES = frozenset(r['code'] for r in _REGIONS)
+
 def initialize_reference_tables():
     """
     Initialize the products and regions reference tables with common values.
@@ -20,48 +50,24 @@ def initialize_reference_tables():
     try:
         client = get_supabase_admin_client()
         
-        # Common products
-        products = [
-            {'name': 'Facebook Ads'},
-            {'name': 'Google Ads'},
-            {'name': 'TikTok Ads'},
-            {'name': 'LinkedIn Ads'},
-            {'name': 'Twitter Ads'},
-            {'name': 'Snapchat Ads'},
-            {'name': 'Pinterest Ads'},
-            {'name': 'YouTube Ads'}
-        ]
-        
-        # Common regions
-        regions = [
-            {'code': 'US'},
-            {'code': 'EU'},
-            {'code': 'APAC'},
-            {'code': 'LATAM'},
-            {'code': 'MENA'},
-            {'code': 'CA'},
-            {'code': 'UK'},
-            {'code': 'AU'}
-        ]
-        
         # Insert products (ignore duplicates)
         try:
-            result = client.table('products').upsert(products, on_conflict='name').execute()
-            print(f"Initialized {len(result.data)} products")
+            result = client.table('products').upsert(list(_PRODUCTS), on_conflict='name').execute()
+            logger.info("Initialized %d products", len(result.data))
         except Exception as e:
-            print(f"Error initializing products: {e}")
+            logger.error("Error initializing products: %s", e)
         
         # Insert regions (ignore duplicates)
         try:
-            result = client.table('regions').upsert(regions, on_conflict='code').execute()
-            print(f"Initialized {len(result.data)} regions")
+            result = client.table('regions').upsert(list(_REGIONS), on_conflict='code').execute()
+            logger.info("Initialized %d regions", len(result.data))
         except Exception as e:
-            print(f"Error initializing regions: {e}")
+            logger.error("Error initializing regions: %s", e)
         
         return True
         
     except Exception as e:
-        print(f"Error initializing reference tables: {e}")
+        logger.error("Error initializing reference tables: %s", e)
         return False
 
 def get_all_products():
@@ -76,7 +82,7 @@ def get_all_products():
         result = client.table('products').select('*').execute()
         return result.data if result.data else []
     except Exception as e:
-        print(f"Error fetching products: {e}")
+        logger.error("Error fetching products: %s", e)
         return []
 
 def get_all_regions():
@@ -91,7 +97,7 @@ def get_all_regions():
         result = client.table('regions').select('*').execute()
         return result.data if result.data else []
     except Exception as e:
-        print(f"Error fetching regions: {e}")
+        logger.error("Error fetching regions: %s", e)
         return []
 
 def add_product(product_name):
@@ -109,14 +115,14 @@ def add_product(product_name):
         result = client.table('products').insert({'name': product_name}).execute()
         
         if result.data:
-            print(f"Added product: {product_name}")
+            logger.debug("Added product: %s", product_name)
             return result.data[0]
         else:
-            print(f"Failed to add product: {product_name}")
+            logger.warning("Failed to add product: %s", product_name)
             return None
             
     except Exception as e:
-        print(f"Error adding product {product_name}: {e}")
+        logger.error("Error adding product %s: %s", product_name, e)
         return None
 
 def add_region(region_code):
@@ -134,55 +140,56 @@ def add_region(region_code):
         result = client.table('regions').insert({'code': region_code}).execute()
         
         if result.data:
-            print(f"Added region: {region_code}")
+            logger.debug("Added region: %s", region_code)
             return result.data[0]
         else:
-            print(f"Failed to add region: {region_code}")
+            logger.warning("Failed to add region: %s", region_code)
             return None
             
     except Exception as e:
-        print(f"Error adding region {region_code}: {e}")
+        logger.error("Error adding region %s: %s", region_code, e)
         return None
 
 def get_status_overview():
     """
     Get an overview of all status records grouped by status type.
     
+    Aggregation happens in Postgres via the `status_overview()` RPC (see
+    schema_reference.md), which returns one row per status with the record
+    count and the distinct products/regions as JSON arrays.
+    
     Returns:
         dict: Status overview with counts
     """
     try:
         client = get_supabase_admin_client()
-        result = client.table('status').select('*').execute()
+        result = client.rpc('status_overview', {}).execute()
         
-        if result.data:
-            overview = {}
-            for record in result.data:
-                status = record['status']
-                if status not in overview:
-                    overview[status] = {
-                        'count': 0,
-                        'products': set(),
-                        'regions': set()
-                    }
-                
-                overview[status]['count'] += 1
-                overview[status]['products'].add(record['product_name'])
-                overview[status]['regions'].add(record['region_code'])
-            
-            # Convert sets to lists for JSON serialization
-            for status in overview:
-                overview[status]['products'] = list(overview[status]['products'])
-                overview[status]['regions'] = list(overview[status]['regions'])
-            
-            return overview
-        else:
-            return {}
+        return _overview_from_rows(result.data)
             
     except Exception as e:
-        print(f"Error getting status overview: {e}")
+        logger.error("Error getting status overview: %s", e)
         return {}
 
+def _overview_from_rows(rows):
+    """
+    Key `status_overview()` RPC rows by status.
+    
+    Args:
+        rows (list): Rows with status, cnt, products and regions
+    
+    Returns:
+        dict: Status overview with counts
+    """
+    return {
+        row['status']: {
+            'count': row['cnt'],
+            'products': row['products'] or [],
+            'regions': row['regions'] or []
+        }
+        for row in rows or []
+    }
+
 def bulk_update_status(insight_ids, new_status, product_name=None, region_code=None):
     """
     Bulk update status for multiple insights.
@@ -217,16 +224,37 @@ def bulk_update_status(insight_ids, new_status, product_name=None, region_code=N
         
         if result.data:
             count = len(result.data)
-            print(f"Updated {count} status records to '{new_status}'")
+            logger.debug("Updated %d status records to '%s'", count, new_status)
             return count
         else:
-            print("No records were updated")
+            logger.debug("No records were updated")
             return 0
             
     except Exception as e:
-        print(f"Error bulk updating status: {e}")
+        logger.error("Error bulk updating status: %s", e)
         return 0
 
+def create_indexes():
+    """
+    Create the status table indexes used by filtered bulk updates.
+    
+    Runs the `create_status_indexes()` RPC (see schema_reference.md), which
+    is idempotent and safe to call on every deploy. It also drops the older
+    `idx_status_product_region` index that the composite index supersedes.
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        client = get_supabase_admin_client()
+        client.rpc('create_status_indexes', {}).execute()
+        logger.info("Status indexes created")
+        return True
+        
+    except Exception as e:
+        logger.error("Error creating status indexes: %s", e)
+        return False
+
 def cleanup_orphaned_status_records():
     """
     Remove status records that reference non-existent insights.
@@ -239,17 +267,25 @@ def cleanup_orphaned_status_records():
         
         # This would require a more complex query in production
         # For now, just return 0 as a placeholder
-        print("Orphaned record cleanup not implemented yet")
+        logger.debug("Orphaned record cleanup not implemented yet")
         return 0
         
     except Exception as e:
-        print(f"Error cleaning up orphaned records: {e}")
+        logger.error("Error cleaning up orphaned records: %s", e)
         return 0
 
-def get_schema_stats():
+def get_schema_stats(exact=False):
     """
     Get statistics about the current database schema.
     
+    Only the insights and status tables are counted. Product and region
+    names are denormalized into `status`, so the reference tables are not
+    needed for stats.
+    
+    Args:
+        exact (bool): Run exact COUNT(*) queries instead of reading the
+            planner's row estimates via the `get_table_row_estimates()` RPC
+    
     Returns:
         dict: Schema statistics
     """
@@ -258,34 +294,202 @@ def get_schema_stats():
         
         stats = {}
         
+        if not exact:
+            # Approximate counts from pg_stat_user_tables in one round trip
+            result = client.rpc('get_table_row_estimates', {}).execute()
+            estimates = {row['relname']: row['n_live_tup'] for row in (result.data or [])}
+            stats['insights_count'] = estimates.get('insights', 0)
+            stats['status_records_count'] = estimates.get('status', 0)
+            return stats
+        
         # Count insights
         insights_result = client.table('insights').select('id', count='exact').execute()
         stats['insights_count'] = insights_result.count if insights_result.count else 0
         
-        # Count products
-        products_result = client.table('products').select('id', count='exact').execute()
-        stats['products_count'] = products_result.count if products_result.count else 0
-        
-        # Count regions
-        regions_result = client.table('regions').select('id', count='exact').execute()
-        stats['regions_count'] = regions_result.count if regions_result.count else 0
-        
         # Count status records
         status_result = client.table('status').select('insight_id', count='exact').execute()
         stats['status_records_count'] = status_result.count if status_result.count else 0
         
-        # Calculate expected vs actual status records
-        expected_status_records = stats['insights_count'] * stats['products_count'] * stats['regions_count']
-        stats['expected_status_records'] = expected_status_records
-        stats['status_coverage_percentage'] = (
-            (stats['status_records_count'] / expected_status_records * 100) 
-            if expected_status_records > 0 else 0
+        return stats
+        
+    except Exception as e:
+        logger.error("Error getting schema stats: %s", e)
+        return {}
+
+# Async variants
+# These mirror the functions above using the async admin client so callers can
+# overlap requests, e.g. asyncio.gather(get_all_products_async(), get_all_regions_async()).
+
+async def get_all_products_async():
+    """
+    Async version of get_all_products.
+    
+    Returns:
+        list: List of product records
+    """
+    try:
+        client = await get_supabase_admin_async_client()
+        result = await client.table('products').select('*').execute()
+        return result.data if result.data else []
+    except Exception as e:
+        logger.error("Error fetching products: %s", e)
+        return []
+
+async def get_all_regions_async():
+    """
+    Async version of get_all_regions.
+    
+    Returns:
+        list: List of region records
+    """
+    try:
+        client = await get_supabase_admin_async_client()
+        result = await client.table('regions').select('*').execute()
+        return result.data if result.data else []
+    except Exception as e:
+        logger.error("Error fetching regions: %s", e)
+        return []
+
+async def add_product_async(product_name):
+    """
+    Async version of add_product.
+    
+    Args:
+        product_name (str): Name of the product
+    
+    Returns:
+        dict: Inserted product record or None if failed
+    """
+    try:
+        client = await get_supabase_admin_async_client()
+        result = await client.table('products').insert({'name': product_name}).execute()
+        
+        if result.data:
+            logger.debug("Added product: %s", product_name)
+            return result.data[0]
+        else:
+            logger.warning("Failed to add product: %s", product_name)
+            return None
+            
+    except Exception as e:
+        logger.error("Error adding product %s: %s", product_name, e)
+        return None
+
+async def add_region_async(region_code):
+    """
+    Async version of add_region.
+    
+    Args:
+        region_code (str): Code of the region
+    
+    Returns:
+        dict: Inserted region record or None if failed
+    """
+    try:
+        client = await get_supabase_admin_async_client()
+        result = await client.table('regions').insert({'code': region_code}).execute()
+        
+        if result.data:
+            logger.debug("Added region: %s", region_code)
+            return result.data[0]
+        else:
+            logger.warning("Failed to add region: %s", region_code)
+            return None
+            
+    except Exception as e:
+        logger.error("Error adding region %s: %s", region_code, e)
+        return None
+
+async def get_status_overview_async():
+    """
+    Async version of get_status_overview.
+    
+    Returns:
+        dict: Status overview with counts
+    """
+    try:
+        client = await get_supabase_admin_async_client()
+        result = await client.rpc('status_overview', {}).execute()
+        
+        return _overview_from_rows(result.data)
+            
+    except Exception as e:
+        logger.error("Error getting status overview: %s", e)
+        return {}
+
+async def bulk_update_status_async(insight_ids, new_status, product_name=None, region_code=None):
+    """
+    Async version of bulk_update_status.
+    
+    Args:
+        insight_ids (list): List of insight UUIDs
+        new_status (str): New status to set
+        product_name (str): Specific product to update (optional)
+        region_code (str): Specific region to update (optional)
+    
+    Returns:
+        int: Number of records updated
+    """
+    try:
+        client = await get_supabase_admin_async_client()
+        
+        query = client.table('status').update({
+            'status': new_status,
+            'updated_at': datetime.now(timezone.utc).isoformat()
+        }).in_('insight_id', insight_ids)
+        
+        if product_name:
+            query = query.eq('product_name', product_name)
+        if region_code:
+            query = query.eq('region_code', region_code)
+        
+        result = await query.execute()
+        
+        if result.data:
+            count = len(result.data)
+            logger.debug("Updated %d status records to '%s'", count, new_status)
+            return count
+        else:
+            logger.debug("No records were updated")
+            return 0
+            
+    except Exception as e:
+        logger.error("Error bulk updating status: %s", e)
+        return 0
+
+async def get_schema_stats_async(exact=False):
+    """
+    Async version of get_schema_stats. Exact counts run concurrently.
+    
+    Args:
+        exact (bool): Run exact COUNT(*) queries instead of row estimates
+    
+    Returns:
+        dict: Schema statistics
+    """
+    try:
+        client = await get_supabase_admin_async_client()
+        
+        if not exact:
+            result = await client.rpc('get_table_row_estimates', {}).execute()
+            estimates = {row['relname']: row['n_live_tup'] for row in (result.data or [])}
+            return {
+                'insights_count': estimates.get('insights', 0),
+                'status_records_count': estimates.get('status', 0)
+            }
+        
+        insights_result, status_result = await asyncio.gather(
+            client.table('insights').select('id', count='exact').execute(),
+            client.table('status').select('insight_id', count='exact').execute()
         )
         
-        return stats
+        return {
+            'insights_count': insights_result.count if insights_result.count else 0,
+            'status_records_count': status_result.count if status_result.count else 0
+        }
         
     except Exception as e:
-        print(f"Error getting schema stats: {e}")
+        logger.error("Error getting schema stats: %s", e)
         return {}
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ Initializes and manages Supabase connection and helpers.
 """
 
 import os
+import asyncio
+from functools import lru_cache
 from supabase import create_client, Client
 from utils.config import Config
 
@@ -62,33 +64,40 @@ class SupabaseManager:
             client = self.get_client()
             print("Testing Supabase connection...")
             
-            # Test connection to all tables in the new schema
-            tables_to_test = ['insights', 'products', 'regions', 'status']
+            # Check all tables in the new schema with a single RPC round trip,
+            # probing each table directly if the function is not deployed yet
+            try:
+                result = client.rpc('check_schema_tables', {}).execute()
+                tables = result.data or {}
+            except Exception as e:
+                print(f"check_schema_tables RPC unavailable ({e}), probing tables directly")
+                tables = {}
+                for table in ('insights', 'products', 'regions', 'status'):
+                    try:
+                        client.table(table).select('*').limit(1).execute()
+                        tables[table] = True
+                    except Exception:
+                        tables[table] = False
+            
+            # A missing key counts as a missing table, so an empty result cannot pass
+            all_exist = True
+            for table in ('insights', 'products', 'regions', 'status'):
+                if tables.get(table) is True:
+                    print(f"✓ {table} table exists")
+                else:
+                    print(f"✗ {table} table not found")
+                    all_exist = False
             
-            for table in tables_to_test:
-                try:
-                    result = client.table(table).select('*').limit(1).execute()
-                    print(f"✓ {table} table accessible ({len(result.data)} records found)")
-                except Exception as table_error:
-                    print(f"✗ {table} table not accessible: {table_error}")
-                    return False
+            if not all_exist:
+                return False
             
-            print("All tables accessible - connection test successful!")
+            print("All tables exist - connection test successful!")
             return True
             
         except Exception as e:
             print(f"Connection test failed: {e}")
             print("This might be because the tables don't exist yet or credentials are incorrect.")
-            
-            # Try a more basic connection test
-            try:
-                # Test with a simple RPC call or auth check
-                client.auth.get_session()
-                print("Basic Supabase connection is working")
-                return True
-            except Exception as e2:
-                print(f"Basic connection also failed: {e2}")
-                return False
+            return False
     
     def get_table_info(self, table_name='insights'):
         """
@@ -124,9 +133,11 @@ def get_supabase_client():
     """
     return supabase_manager.get_client()
 
+@lru_cache(maxsize=1)
 def get_supabase_admin_client():
     """
     Get Supabase client with service role key for admin operations (bypasses RLS).
+    The client is created once and reused, so its HTTP connections stay warm.
     
     Returns:
         Client: Supabase admin client instance
@@ -136,6 +147,36 @@ def get_supabase_admin_client():
     
     return create_client(Config.SUPABASE_URL, Config.SUPABASE_SERVICE_ROLE_KEY)
 
+# Async admin clients keyed by event loop (httpx async sessions are loop-bound).
+# Entries for loops that have since closed are evicted on the next lookup.
+_async_admin_clients = {}
+
+async def get_supabase_admin_async_client():
+    """
+    Get the async Supabase admin client for the running event loop.
+    The async client ships with supabase 2.4.0 and later, so it is imported
+    here rather than at module scope to keep the sync helpers usable on the
+    pinned release.
+    
+    Returns:
+        AsyncClient: Supabase async admin client instance
+    """
+    if not Config.SUPABASE_SERVICE_ROLE_KEY:
+        raise ValueError("Service role key not configured - cannot create admin client")
+    
+    from supabase._async.client import create_client as create_async_client
+    
+    loop = asyncio.get_running_loop()
+    client = _async_admin_clients.get(loop)
+    if client is None:
+        # Drop clients left behind by finished asyncio.run() calls
+        for closed_loop in [other for other in _async_admin_clients if other.is_closed()]:
+            del _async_admin_clients[closed_loop]
+        client = await create_async_client(Config.SUPABASE_URL, Config.SUPABASE_SERVICE_ROLE_KEY)
+        _async_admin_clients[loop] = client
+    
+    return client
+
 def initialize_supabase(url=None, key=None):
     """
     Initialize the global Supabase client.
@@ -3,62 +3,87 @@ Configuration management utilities.
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
 from dotenv import load_dotenv
 
+# Project-level .env file (utils/ lives one level below the project root)
+DOTENV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
+
+def _load_env_once():
+    """
+    Load environment variables from the project .env file once per process.
+    
+    The guard lives in os.environ so it survives module reloads. Set
+    SKIP_DOTENV=1 in production to rely on real environment variables only.
+    """
+    if os.environ.get('_DOTENV_LOADED') or os.environ.get('SKIP_DOTENV'):
+        return
+    
+    load_dotenv(dotenv_path=DOTENV_PATH, override=False)
+    os.environ['_DOTENV_LOADED'] = '1'
+
 # Load environment variables from .env file
-load_dotenv()
+_load_env_once()
 
-class Config:
+@dataclass(frozen=True, slots=True, eq=False)
+class _Config:
     """
-    Configuration class for pipeline settings.
+    Configuration for pipeline settings, read from the environment once at import.
+    Use the module-level Config instance; it is immutable.
     """
     
     # Supabase settings
-    SUPABASE_URL = os.getenv('SUPABASE_URL')
-    SUPABASE_KEY = os.getenv('SUPABASE_ANON_KEY')  # Using anon key for regular operations
-    SUPABASE_SERVICE_ROLE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')  # For admin operations if needed
-    SUPABASE_SCHEMA = os.getenv('SUPABASE_SCHEMA', 'public')
+    SUPABASE_URL: Optional[str] = os.getenv('SUPABASE_URL')
+    SUPABASE_KEY: Optional[str] = os.getenv('SUPABASE_ANON_KEY')  # Using anon key for regular operations
+    SUPABASE_SERVICE_ROLE_KEY: Optional[str] = os.getenv('SUPABASE_SERVICE_ROLE_KEY')  # For admin operations if needed
+    SUPABASE_SCHEMA: str = os.getenv('SUPABASE_SCHEMA', 'public')
     
     # API keys
-    REDDIT_CLIENT_ID = os.getenv('REDDIT_CLIENT_ID')
-    REDDIT_CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET')
-    REDDIT_USER_AGENT = os.getenv('REDDIT_USER_AGENT', 'AdCreativeBot/1.0')
-    REDDIT_USERNAME = os.getenv('REDDIT_USERNAME')
-    REDDIT_PASSWORD = os.getenv('REDDIT_PASSWORD')
+    REDDIT_CLIENT_ID: Optional[str] = os.getenv('REDDIT_CLIENT_ID')
+    REDDIT_CLIENT_SECRET: Optional[str] = os.getenv('REDDIT_CLIENT_SECRET')
+    REDDIT_USER_AGENT: str = os.getenv('REDDIT_USER_AGENT', 'AdCreativeBot/1.0')
+    REDDIT_USERNAME: Optional[str] = os.getenv('REDDIT_USERNAME')
+    REDDIT_PASSWORD: Optional[str] = os.getenv('REDDIT_PASSWORD')
     
-    TWITTER_BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN')
-    TWITTER_API_KEY = os.getenv('TWITTER_API_KEY')
-    TWITTER_API_SECRET = os.getenv('TWITTER_API_SECRET')
+    TWITTER_BEARER_TOKEN: Optional[str] = os.getenv('TWITTER_BEARER_TOKEN')
+    TWITTER_API_KEY: Optional[str] = os.getenv('TWITTER_API_KEY')
+    TWITTER_API_SECRET: Optional[str] = os.getenv('TWITTER_API_SECRET')
     
-    META_ACCESS_TOKEN = os.getenv('META_ACCESS_TOKEN')
-    META_APP_ID = os.getenv('META_APP_ID')
-    META_APP_SECRET = os.getenv('META_APP_SECRET')
+    META_ACCESS_TOKEN: Optional[str] = os.getenv('META_ACCESS_TOKEN')
+    META_APP_ID: Optional[str] = os.getenv('META_APP_ID')
+    META_APP_SECRET: Optional[str] = os.getenv('META_APP_SECRET')
     
-    LINKEDIN_CLIENT_ID = os.getenv('LINKEDIN_CLIENT_ID')
-    LINKEDIN_CLIENT_SECRET = os.getenv('LINKEDIN_CLIENT_SECRET')
+    LINKEDIN_CLIENT_ID: Optional[str] = os.getenv('LINKEDIN_CLIENT_ID')
+    LINKEDIN_CLIENT_SECRET: Optional[str] = os.getenv('LINKEDIN_CLIENT_SECRET')
     
     # LLM API keys
-    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-    ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
-    GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
+    OPENAI_API_KEY: Optional[str] = os.getenv('OPENAI_API_KEY')
+    ANTHROPIC_API_KEY: Optional[str] = os.getenv('ANTHROPIC_API_KEY')
+    GOOGLE_API_KEY: Optional[str] = os.getenv('GOOGLE_API_KEY')
     
     # Pipeline settings
-    SIMILARITY_THRESHOLD = float(os.getenv('SIMILARITY_THRESHOLD', '0.8'))
-    MAX_PARAGRAPHS = int(os.getenv('MAX_PARAGRAPHS', '4'))
-    MIN_TEXT_LENGTH = int(os.getenv('MIN_TEXT_LENGTH', '50'))
-    BATCH_SIZE = int(os.getenv('BATCH_SIZE', '10'))
+    SIMILARITY_THRESHOLD: float = float(os.getenv('SIMILARITY_THRESHOLD', '0.8'))
+    MAX_PARAGRAPHS: int = int(os.getenv('MAX_PARAGRAPHS', '4'))
+    MIN_TEXT_LENGTH: int = int(os.getenv('MIN_TEXT_LENGTH', '50'))
+    BATCH_SIZE: int = int(os.getenv('BATCH_SIZE', '10'))
+    
+    # LLM response cache for identical structuring prompts (off by default)
+    LLM_CACHE_ENABLED: bool = os.getenv('LLM_CACHE_ENABLED', 'false').lower() == 'true'
+    LLM_CACHE_DIR: str = os.getenv('LLM_CACHE_DIR', '.cache/structuring')
     
     # Web scraping settings
-    USER_AGENT = os.getenv('USER_AGENT', 'Mozilla/5.0 (compatible; AdCreativeBot/1.0)')
-    REQUEST_DELAY = float(os.getenv('REQUEST_DELAY', '1.0'))
-    MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
+    USER_AGENT: str = os.getenv('USER_AGENT', 'Mozilla/5.0 (compatible; AdCreativeBot/1.0)')
+    REQUEST_DELAY: float = float(os.getenv('REQUEST_DELAY', '1.0'))
+    MAX_RETRIES: int = int(os.getenv('MAX_RETRIES', '3'))
     
     # Logging settings
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE = os.getenv('LOG_FILE', 'pipeline.log')
+    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FILE: str = os.getenv('LOG_FILE', 'pipeline.log')
     
-    @classmethod
-    def validate_required_settings(cls):
+    def validate_required_settings(self):
         """
         Validate that required configuration settings are present.
         
@@ -72,51 +97,54 @@ class Config:
         
         missing_settings = []
         for setting in required_settings:
-            if not getattr(cls, setting):
+            if not getattr(self, setting):
                 missing_settings.append(setting)
         
         return len(missing_settings) == 0, missing_settings
     
-    @classmethod
-    def get_api_config(cls, service):
+    @lru_cache(maxsize=None)
+    def get_api_config(self, service):
         """
         Get API configuration for a specific service.
+        The result is cached per service.
         
         Args:
             service (str): Service name (reddit, twitter, meta, linkedin, openai, etc.)
         
         Returns:
-            dict: API configuration for the service
+            MappingProxyType: Read-only API configuration for the service
         """
         configs = {
             'reddit': {
-                'client_id': cls.REDDIT_CLIENT_ID,
-                'client_secret': cls.REDDIT_CLIENT_SECRET,
-                'user_agent': cls.REDDIT_USER_AGENT
+                'client_id': self.REDDIT_CLIENT_ID,
+                'client_secret': self.REDDIT_CLIENT_SECRET,
+                'user_agent': self.REDDIT_USER_AGENT
             },
             'twitter': {
-                'bearer_token': cls.TWITTER_BEARER_TOKEN,
-                'api_key': cls.TWITTER_API_KEY,
-                'api_secret': cls.TWITTER_API_SECRET
+                'bearer_token': self.TWITTER_BEARER_TOKEN,
+                'api_key': self.TWITTER_API_KEY,
+                'api_secret': self.TWITTER_API_SECRET
             },
             'meta': {
-                'access_token': cls.META_ACCESS_TOKEN,
-                'app_id': cls.META_APP_ID,
-                'app_secret': cls.META_APP_SECRET
+                'access_token': self.META_ACCESS_TOKEN,
+                'app_id': self.META_APP_ID,
+                'app_secret': self.META_APP_SECRET
             },
             'linkedin': {
-                'client_id': cls.LINKEDIN_CLIENT_ID,
-                'client_secret': cls.LINKEDIN_CLIENT_SECRET
+                'client_id': self.LINKEDIN_CLIENT_ID,
+                'client_secret': self.LINKEDIN_CLIENT_SECRET
             },
             'openai': {
-                'api_key': cls.OPENAI_API_KEY
+                'api_key': self.OPENAI_API_KEY
             },
             'anthropic': {
-                'api_key': cls.ANTHROPIC_API_KEY
+                'api_key': self.ANTHROPIC_API_KEY
             },
             'google': {
-                'api_key': cls.GOOGLE_API_KEY
+                'api_key': self.GOOGLE_API_KEY
             }
         }
         
-        return configs.get(service, {})
\ No newline at end of file
+        return MappingProxyType(configs.get(service, {}))
+
+Config = _Config()
\ No newline at end of file
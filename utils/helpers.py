@@ -4,9 +4,20 @@ General helper utilities for the pipeline.
 
 import time
 import uuid
+import array
+import random
+import asyncio
+import inspect
+import logging
+from itertools import islice
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from functools import wraps
 
+# A plain module logger: setup_logger opens a log file, which would make importing
+# these helpers fail wherever the working directory is read-only (e.g. Vercel)
+logger = logging.getLogger(__name__)
+
 def generate_uuid():
     """
     Generate a UUID string.
@@ -25,63 +36,125 @@ def get_current_timestamp():
     """
     return datetime.now(timezone.utc)
 
+# Last formatted timestamp, reused for calls within the same millisecond
+_last_timestamp_ms = 0
+_last_timestamp_iso = ""
+
 def get_current_timestamp_iso():
     """
     Get current UTC timestamp as ISO string.
+    Calls within the same millisecond return the same cached string.
     
     Returns:
         str: Current UTC timestamp in ISO format
     """
-    return get_current_timestamp().isoformat()
+    global _last_timestamp_ms, _last_timestamp_iso
+    
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _last_timestamp_ms:
+        # Benign race: concurrent callers may both reformat the same millisecond
+        _last_timestamp_iso = datetime.fromtimestamp(now_ms / 1000, tz=timezone.utc).isoformat(timespec='milliseconds')
+        _last_timestamp_ms = now_ms
+    
+    return _last_timestamp_iso
 
-def retry_on_failure(max_retries=3, delay=1.0, backoff=2.0):
+def retry_on_failure(max_retries=3, delay=1.0, backoff=2.0, max_delay=30.0, retry_on=(Exception,)):
     """
     Decorator to retry function calls on failure.
+    Works with both regular and async functions; async functions sleep with
+    asyncio.sleep so the event loop keeps running between attempts.
     
     Args:
         max_retries (int): Maximum number of retry attempts
         delay (float): Initial delay between retries in seconds
         backoff (float): Backoff multiplier for delay
+        max_delay (float): Upper bound for the delay between retries in seconds
+        retry_on (tuple): Exception types that trigger a retry; others are raised immediately
     
     Returns:
         function: Decorated function with retry logic
     """
+    def jittered(current_delay):
+        # Spread retries from concurrent callers so they don't fire in lockstep
+        return current_delay * random.uniform(0.5, 1.5)
+    
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                current_delay = delay
+                
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except retry_on as e:
+                        if attempt >= max_retries:
+                            logger.warning("All %d attempts failed.", max_retries + 1)
+                            raise
+                        sleep_for = jittered(current_delay)
+                        logger.warning("Attempt %d failed: %s. Retrying in %.2f seconds...", attempt + 1, e, sleep_for)
+                        await asyncio.sleep(sleep_for)
+                        current_delay = min(current_delay * backoff, max_delay)
+            
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             current_delay = delay
-            last_exception = None
             
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        print(f"Attempt {attempt + 1} failed: {e}. Retrying in {current_delay} seconds...")
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        print(f"All {max_retries + 1} attempts failed.")
-            
-            raise last_exception
+                except retry_on as e:
+                    if attempt >= max_retries:
+                        logger.warning("All %d attempts failed.", max_retries + 1)
+                        raise
+                    sleep_for = jittered(current_delay)
+                    logger.warning("Attempt %d failed: %s. Retrying in %.2f seconds...", attempt + 1, e, sleep_for)
+                    time.sleep(sleep_for)
+                    current_delay = min(current_delay * backoff, max_delay)
         
         return wrapper
     return decorator
 
 def chunk_list(lst, chunk_size):
     """
-    Split a list into chunks of specified size.
+    Split an iterable into chunks of specified size.
+    Sequences (lists, tuples, strings) are sliced, so chunks keep their type;
+    bytes-like inputs yield zero-copy memoryview slices; any other iterable
+    (including generators) is consumed lazily into lists.
     
     Args:
-        lst (list): List to chunk
-        chunk_size (int): Size of each chunk
+        lst (iterable): Iterable to chunk
+        chunk_size (int): Size of each chunk, at least 1
     
     Yields:
-        list: Chunks of the original list
+        Chunks of the original iterable (memoryview for bytes-like input,
+        list for non-sequence iterables)
+    
+    Raises:
+        ValueError: If chunk_size is less than 1
     """
-    for i in range(0, len(lst), chunk_size):
-        yield lst[i:i + chunk_size]
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    
+    if isinstance(lst, (bytes, bytearray, memoryview, array.array)):
+        view = memoryview(lst)
+        for i in range(0, len(view), chunk_size):
+            yield view[i:i + chunk_size]
+        return
+    
+    if isinstance(lst, Sequence):
+        for i in range(0, len(lst), chunk_size):
+            yield lst[i:i + chunk_size]
+        return
+    
+    iterator = iter(lst)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
 
 def safe_get(dictionary, key, default=None):
     """
@@ -95,6 +168,9 @@ def safe_get(dictionary, key, default=None):
     Returns:
         Value from dictionary or default
     """
+    if type(dictionary) is dict:
+        return dictionary.get(key, default)
+    
     try:
         return dictionary.get(key, default)
     except (AttributeError, TypeError):
@@ -117,6 +193,26 @@ def truncate_text(text, max_length=100, suffix="..."):
     
     return text[:max_length - len(suffix)] + suffix
 
+def make_truncator(max_length=100, suffix="..."):
+    """
+    Build a truncate_text equivalent specialised for a fixed length and suffix.
+    
+    Args:
+        max_length (int): Maximum length of text
+        suffix (str): Suffix to add if truncated
+    
+    Returns:
+        function: Function taking text and returning the truncated text
+    """
+    keep = max_length - len(suffix)
+    
+    def truncate(text):
+        if not text or len(text) <= max_length:
+            return text
+        return text[:keep] + suffix
+    
+    return truncate
+
 def measure_execution_time(func):
     """
     Decorator to measure function execution time.
@@ -125,15 +221,14 @@ def measure_execution_time(func):
         func: Function to measure
     
     Returns:
-        function: Decorated function that prints execution time
+        function: Decorated function that logs execution time
     """
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time = end_time - start_time
-        print(f"{func.__name__} executed in {execution_time:.2f} seconds")
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.debug("%s executed in %.3f ms", func.__name__, elapsed_ms)
         return result
     
     return wrapper
\ No newline at end of file
@@ -2,13 +2,72 @@
 Logging utilities for the Ad-Creative Insight Pipeline.
 """
 
+import atexit
 import logging
 import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 
+# Rotate the log file at 10 MB, keeping 5 backups
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# One queue handler (and listener thread) per log file, shared by every named logger
+_shared_handlers = {}
+_shared_handlers_lock = threading.Lock()
+
+def _get_shared_handler(log_file):
+    """
+    Get the shared queue handler writing to the console and the given log file.
+    The console/file handlers and the listener thread are created on first use.
+    
+    Args:
+        log_file (str): Path to log file
+    
+    Returns:
+        logging.Handler: Queue handler to attach to loggers
+    """
+    key = os.path.abspath(log_file)
+    
+    with _shared_handlers_lock:
+        handler = _shared_handlers.get(key)
+        if handler:
+            return handler
+        
+        # Create formatters
+        console_formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        file_formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+        )
+        
+        # Console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(console_formatter)
+        
+        # File handler
+        file_handler = RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(file_formatter)
+        
+        # Hand records to a background thread so console/file I/O stays off the caller's thread
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        handler = QueueHandler(log_queue)
+        _shared_handlers[key] = handler
+        return handler
+
 def setup_logger(name="pipeline", level=None, log_file=None):
     """
     Set up a logger with console and file handlers.
+    Handlers are shared between loggers writing to the same file.
     
     Args:
         name (str): Logger name
@@ -27,28 +86,12 @@ def setup_logger(name="pipeline", level=None, log_file=None):
     logger.setLevel(getattr(logging, level.upper()))
     
     # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
-    
-    # Create formatters
-    console_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handler = _get_shared_handler(log_file)
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
     
-    # File handler
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    # Records are fully handled here; don't emit them again via the root logger
+    logger.propagate = False
     
     return logger
 
@@ -3,27 +3,84 @@ Simple Flask web frontend for the Ad-Creative Insight Pipeline.
 Shows real-time progress of pipeline execution.
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, make_response, abort
+from flask.json.provider import DefaultJSONProvider
 import sys
 import os
+import gzip
+import hmac
+import time
+import uuid
+import queue
+import atexit
+import logging
+import threading
+from functools import wraps
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+# api/index.py puts the project root on the path for Vercel; running this file directly needs it too
+if __name__ == '__main__':
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+# Log through a queue so writing to stderr happens on a listener thread, not in the request.
+# utils.logger is not used here because its log file cannot be written on Vercel.
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger('web_frontend')
+logger.setLevel(logging.WARNING)
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+
+# The pipeline itself never runs in the serverless build, so main is not imported
+PIPELINE_AVAILABLE = False
+
+# Database dependencies are imported once here; endpoints fall back to mock data without them
+try:
+    from supabase_storage.supabase_client import get_supabase_admin_client
+    from supabase_storage.insight_inserter import move_insight_to_testing
+    from deduplication.supabase_lookup import get_insight_status_summary
+    DATABASE_AVAILABLE = True
+except (ImportError, OSError) as e:
+    # OSError covers import-time side effects such as a log file that cannot be opened
+    logger.warning("Database dependencies not available: %s", e)
+    DATABASE_AVAILABLE = False
 
-# Try to import main pipeline, but handle gracefully if dependencies are missing
+# orjson is optional; without it responses use Flask's stdlib-based encoder
 try:
-    from main import run_pipeline
-    PIPELINE_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Pipeline dependencies not available: {e}")
-    PIPELINE_AVAILABLE = False
+    import orjson
+except ImportError:
+    orjson = None
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson when it is installed."""
+    
+    def dumps(self, obj, **kwargs):
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        if orjson is None:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
     
-    def run_pipeline(config):
-        return {"error": "Pipeline dependencies not available"}
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default), mimetype=self.mimetype)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-secret-key-here')
 
 # Configure Flask for Vercel serverless environment
@@ -33,15 +90,323 @@ app.config['DEBUG'] = False
 # For Vercel serverless environment, we'll disable SocketIO and use polling instead
 SOCKETIO_AVAILABLE = False
 
-# Global variables to track pipeline state (simplified for Vercel)
-pipeline_status = {
-    'running': False,
-    'current_step': None,
-    'total_insights': 0,
-    'errors': ['Pipeline execution not available in serverless environment'],
-    'message': 'Use the insights management page to view existing data'
+# JSON responses smaller than this are not worth compressing
+GZIP_MIN_SIZE = 500
+GZIP_LEVEL = 6
+
+# Upper bound on the page size accepted by /api/insights
+MAX_PAGE_SIZE = 100
+
+# Seconds the insights total count is reused before querying it again
+INSIGHTS_COUNT_TTL = 60
+
+# Seconds products and regions are served from memory; they rarely change
+REFERENCE_DATA_TTL = 300
+
+# Products/regions snapshot written by scripts/dump_reference.py before deploying
+REFERENCE_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'reference.json')
+
+# Rows fetched per keyset query by /api/insights/stream
+INSIGHTS_STREAM_CHUNK_SIZE = 40
+
+# Recently served or prefetched /api/insights pages, keyed by (page, limit).
+# Each serverless instance keeps its own cache, so a status update handled by
+# another instance can leave a page stale here for up to INSIGHTS_PAGE_TTL.
+INSIGHTS_PAGE_TTL = 30
+INSIGHTS_PAGE_CACHE_SIZE = 32
+
+class PipelineState:
+    """
+    Thread-safe holder for the pipeline status shown in the dashboard.
+    Writes go through the lock; readers get the cached JSON.
+    """
+    
+    def __init__(self, status):
+        self._lock = threading.Lock()
+        self._status = dict(status)
+        self._json = None
+        self._gzip = None
+    
+    def reset(self, status):
+        """Replace the whole status in place."""
+        with self._lock:
+            self._status.clear()
+            self._status.update(status)
+            self._json = None
+            self._gzip = None
+    
+    def to_json(self):
+        """Get the status as a JSON string, serializing only after a change."""
+        with self._lock:
+            if self._json is None:
+                self._json = app.json.dumps(self._status)
+            return self._json
+    
+    def to_gzip(self):
+        """Get the gzip-compressed JSON status, compressing only after a change."""
+        with self._lock:
+            if self._gzip is None:
+                if self._json is None:
+                    self._json = app.json.dumps(self._status)
+                self._gzip = gzip.compress(self._json.encode('utf-8'), compresslevel=GZIP_LEVEL)
+            return self._gzip
+
+# Pipeline steps shown on the dashboard, in execution order
+STEP_NAMES = ('data_collection', 'cleaning', 'structuring', 'deduplication', 'storage')
+
+def _fresh_status():
+    """
+    Build the initial pipeline status.
+    
+    Returns:
+        dict: Status with every step pending
+    """
+    return {
+        'running': False,
+        'current_step': None,
+        'steps': {name: {'status': 'pending', 'count': 0, 'message': ''} for name in STEP_NAMES},
+        'total_insights': 0,
+        'start_time': None,
+        'end_time': None,
+        'errors': ['Pipeline execution not available in serverless environment'],
+        'scraped_data': [],
+        'message': 'Use the insights management page to view existing data'
+    }
+
+# Global pipeline state (simplified for Vercel)
+pipeline_state = PipelineState(_fresh_status())
+
+# Worker threads for Supabase queries that can run alongside the request
+_executor = ThreadPoolExecutor(max_workers=8)
+
+# In-process response cache: key -> (expiry time, value)
+_cache = {}
+_cache_lock = threading.Lock()
+
+def _ttl_cache(key, ttl, loader, refresh=False):
+    """
+    Get a cached value, calling loader to (re)fill it once it has expired.
+    
+    Args:
+        key (str): Cache key
+        ttl (float): Seconds a loaded value stays valid
+        loader (callable): Zero-argument function producing the value
+        refresh (bool): Reload even if the cached value is still valid
+    
+    Returns:
+        Any: Cached or freshly loaded value
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry and not refresh and entry[0] > now:
+        return entry[1]
+    
+    value = loader()
+    with _cache_lock:
+        _cache[key] = (now + ttl, value)
+    return value
+
+_page_cache = OrderedDict()
+# Bumped on every clear so fetches that started before it are not stored
+_page_generation = 0
+
+def _get_page_generation():
+    """Get the page cache generation to pass to _store_page after fetching."""
+    with _cache_lock:
+        return _page_generation
+
+def _get_cached_page(page, limit):
+    """Get a fresh cached insights page, or None."""
+    with _cache_lock:
+        entry = _page_cache.get((page, limit))
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        _page_cache.move_to_end((page, limit))
+        return entry[1]
+
+def _store_page(page, limit, insights, generation):
+    """
+    Cache an insights page, evicting the least recently used ones.
+    The page is dropped if the cache was cleared since generation was read.
+    """
+    with _cache_lock:
+        if generation != _page_generation:
+            return
+        _page_cache[(page, limit)] = (time.monotonic() + INSIGHTS_PAGE_TTL, insights)
+        _page_cache.move_to_end((page, limit))
+        while len(_page_cache) > INSIGHTS_PAGE_CACHE_SIZE:
+            _page_cache.popitem(last=False)
+
+def _clear_page_cache():
+    """
+    Drop cached insights pages, e.g. after a status change.
+    Only affects this process; other instances expire theirs via the TTL.
+    """
+    global _page_generation
+    with _cache_lock:
+        _page_generation += 1
+        _page_cache.clear()
+
+def _count_insights(client):
+    """Get the planner's estimated row count of the insights table."""
+    result = client.table('insights').select('id', count='estimated').limit(1).execute()
+    return result.count if result.count else 0
+
+def _load_products():
+    """Load product names from Supabase."""
+    client = get_supabase_admin_client()
+    result = client.table('products').select('name').execute()
+    return [p['name'] for p in result.data] if result.data else []
+
+def _load_regions():
+    """Load region codes from Supabase."""
+    client = get_supabase_admin_client()
+    result = client.table('regions').select('code').execute()
+    return [r['code'] for r in result.data] if result.data else []
+
+def _load_reference_snapshot():
+    """
+    Read the bundled products/regions snapshot.
+    
+    Returns:
+        dict: Snapshot with 'products' and 'regions' lists, or empty if not generated
+    """
+    try:
+        with open(REFERENCE_SNAPSHOT_PATH, 'rb') as f:
+            return app.json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def _write_reference_snapshot(snapshot):
+    """Atomically rewrite the bundled products/regions snapshot."""
+    os.makedirs(os.path.dirname(REFERENCE_SNAPSHOT_PATH), exist_ok=True)
+    tmp_path = f"{REFERENCE_SNAPSHOT_PATH}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(app.json.dumps(snapshot))
+    os.replace(tmp_path, REFERENCE_SNAPSHOT_PATH)
+
+_reference_snapshot = _load_reference_snapshot()
+
+# Fallback data served when Supabase is unavailable; the fixed responses are encoded once
+DEFAULT_PRODUCTS = ('Facebook Ads', 'Google Ads', 'TikTok Ads', 'LinkedIn Ads')
+DEFAULT_REGIONS = ('US', 'EU', 'APAC', 'LATAM', 'MENA', 'CA', 'UK', 'AU')
+_DEFAULT_PRODUCTS_BYTES = app.json.dumps({'products': DEFAULT_PRODUCTS, 'note': 'Using default products'}).encode('utf-8')
+_DEFAULT_REGIONS_BYTES = app.json.dumps({'regions': DEFAULT_REGIONS, 'note': 'Using default regions'}).encode('utf-8')
+
+# Mock insights shown without a database connection (at most 5 per page)
+MOCK_INSIGHTS = tuple(
+    {
+        'id': f'mock-{i}',
+        'insight': f'Sample insight {i}: This is a mock insight for testing the interface.',
+        'difference_score': 0.8,
+        'status': 'Not Tested',
+        'status_details': {'total_combinations': 0}
+    }
+    for i in range(1, 6)
+)
+ERROR_MOCK_INSIGHT = {
+    'id': 'error-mock',
+    'insight': 'Unable to connect to database. This is mock data for testing.',
+    'difference_score': 0,
+    'status': 'Error',
+    'status_details': {'total_combinations': 0}
 }
 
+def cache_json(seconds=60):
+    """
+    Decorator adding Cache-Control and an ETag to a JSON endpoint.
+    Answers 304 when the client's copy still matches; error payloads are not cached.
+    
+    Args:
+        seconds (int): max-age clients and CDNs may reuse the response for
+    
+    Returns:
+        function: Decorator for Flask view functions
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            response = make_response(func(*args, **kwargs))
+            if response.status_code != 200 or 'error' in (response.get_json(silent=True) or {}):
+                return response
+            
+            response.cache_control.public = True
+            response.cache_control.max_age = seconds
+            # Weak because compress_json_response may re-encode the body
+            response.add_etag(weak=True)
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+def _fetch_insights_page(client, limit, offset=0, after_id=None):
+    """
+    Fetch one page of insights with their test status.
+    
+    Args:
+        client: Supabase client
+        limit (int): Page size
+        offset (int): Rows to skip (ignored when after_id is given)
+        after_id (str): Keyset cursor; return insights with a smaller id
+    
+    Returns:
+        list: Insights formatted for the insights page
+    """
+    # One round trip: the get_insights_with_status() RPC (see schema_reference.md)
+    # joins each insight's status breakdown with a LATERAL subquery and only
+    # returns the list columns; the heavy text fields load via /api/insights/<id>/full
+    result = client.rpc('get_insights_with_status', {
+        'p_limit': limit,
+        'p_offset': offset,
+        'p_after_id': after_id
+    }).execute()
+    
+    insights = []
+    for row in result.data or []:
+        insights.append({
+            'id': row['id'],
+            'insight': row['insight'],
+            'difference_score': row.get('difference_score', 0),
+            'status': 'Tested' if row['total_combinations'] else 'Not Tested',
+            'status_details': {
+                'total_combinations': row['total_combinations'],
+                'status_breakdown': row['status_breakdown']
+            }
+        })
+    
+    return insights
+
+def _prefetch_page(client, page, limit):
+    """Load an insights page into the page cache before it is requested."""
+    if _get_cached_page(page, limit) is not None:
+        return
+    
+    try:
+        generation = _get_page_generation()
+        _store_page(page, limit, _fetch_insights_page(client, limit, (page - 1) * limit), generation)
+    except Exception as e:
+        logger.warning("Error prefetching insights page %s: %s", page, e)
+
+@app.after_request
+def compress_json_response(response):
+    """Gzip JSON responses for clients that accept it."""
+    if response.mimetype != 'application/json' or response.direct_passthrough:
+        return response
+    if 'Content-Encoding' in response.headers:
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    if 'gzip' not in request.accept_encodings:
+        return response
+    
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
 def emit_progress_update():
     """Emit progress update to all connected clients."""
     # SocketIO disabled for Vercel serverless environment
@@ -77,7 +442,12 @@ def config():
 @app.route('/api/status')
 def get_status():
     """Get current pipeline status."""
-    return jsonify(pipeline_status)
+    if 'gzip' in request.accept_encodings:
+        response = app.response_class(pipeline_state.to_gzip(), mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        return response
+    return app.response_class(pipeline_state.to_json(), mimetype='application/json')
 
 @app.route('/api/start', methods=['POST'])
 def start_pipeline():
@@ -92,104 +462,106 @@ def start_pipeline():
 @app.route('/api/reset', methods=['POST'])
 def reset_pipeline():
     """Reset pipeline status."""
-    global pipeline_status
-    pipeline_status = {
-        'running': False,
-        'current_step': None,
-        'total_insights': 0,
-        'errors': ['Pipeline execution not available in serverless environment'],
-        'message': 'Use the insights management page to view existing data'
-    }
+    pipeline_state.reset(_fresh_status())
     return jsonify({'message': 'Pipeline status reset'})
 
 # Insights Management API Endpoints
 
+def _paginate_args():
+    """
+    Read page and limit from the query string, clamped to safe bounds.
+    Aborts with a 400 JSON error if either is not an integer.
+    
+    Returns:
+        tuple: (page, limit) with page >= 1 and 1 <= limit <= MAX_PAGE_SIZE
+    """
+    try:
+        page = int(request.args.get('page', 1))
+        limit = int(request.args.get('limit', 10))
+    except ValueError:
+        abort(make_response(jsonify({'error': 'page and limit must be integers'}), 400))
+    
+    return max(1, page), min(MAX_PAGE_SIZE, max(1, limit))
+
+def _cursor_arg():
+    """
+    Read the after_id keyset cursor from the query string.
+    Aborts with a 400 JSON error if it is not a UUID.
+    
+    Returns:
+        str: Normalised insight id, or None when no cursor was given
+    """
+    after_id = request.args.get('after_id')
+    if not after_id:
+        return None
+    
+    try:
+        return str(uuid.UUID(after_id))
+    except ValueError:
+        abort(make_response(jsonify({'error': 'after_id must be an insight id'}), 400))
+
 @app.route('/api/insights')
+@cache_json(seconds=0)
 def get_insights():
     """Get insights with pagination."""
-    # Get pagination parameters
-    page = int(request.args.get('page', 1))
-    limit = int(request.args.get('limit', 10))
+    page, limit = _paginate_args()
     offset = (page - 1) * limit
     
+    # Cursor from a previous response's next_cursor; takes precedence over page
+    after_id = _cursor_arg()
+    refresh_count = request.args.get('refresh_count') == '1'
+    
+    if not DATABASE_AVAILABLE:
+        # Return mock data if dependencies aren't available
+        return jsonify({
+            'insights': MOCK_INSIGHTS[:limit],
+            'total_count': 5,
+            'page': page,
+            'limit': limit,
+            'total_pages': 1,
+            'note': 'Showing mock data - pipeline dependencies not available'
+        })
+    
     # Try to get real data from Supabase
     try:
-        from supabase import create_client
-        from utils.config import Config
+        client = get_supabase_admin_client()
         
-        # Create client directly to avoid the proxy issue
-        client = create_client(Config.SUPABASE_URL, Config.SUPABASE_SERVICE_ROLE_KEY)
+        # Fetch the total alongside the page rows (usually a cache hit)
+        count_future = _executor.submit(
+            _ttl_cache, 'insights_count', INSIGHTS_COUNT_TTL, lambda: _count_insights(client), refresh_count
+        )
         
-        # Get total count
-        count_result = client.table('insights').select('id', count='exact').execute()
-        total_count = count_result.count if count_result.count else 0
+        if after_id:
+            insights = _fetch_insights_page(client, limit, after_id=after_id)
+        else:
+            insights = _get_cached_page(page, limit)
+            if insights is None:
+                generation = _get_page_generation()
+                insights = _fetch_insights_page(client, limit, offset)
+                _store_page(page, limit, insights, generation)
         
-        # Get insights with pagination
-        result = client.table('insights').select('*').range(offset, offset + limit - 1).order('id', desc=True).execute()
+        next_cursor = insights[-1]['id'] if len(insights) == limit else None
+        total_count = count_future.result()
         
-        insights = []
-        if result.data:
-            for insight in result.data:
-                insights.append({
-                    'id': insight['id'],
-                    'insight': insight['insight'],
-                    'results': insight.get('results', ''),
-                    'limitations_context': insight.get('limitations_context', ''),
-                    'difference_score': insight.get('difference_score', 0),
-                    'status': 'Not Tested',  # Simplified for now
-                    'status_details': {'total_combinations': 0}
-                })
+        # Warm the next page while the user reads this one
+        if not after_id and len(insights) == limit:
+            _executor.submit(_prefetch_page, client, page + 1, limit)
         
         return jsonify({
             'insights': insights,
             'total_count': total_count,
             'page': page,
             'limit': limit,
-            'total_pages': (total_count + limit - 1) // limit
-        })
-        
-    except ImportError as e:
-        # Return mock data if dependencies aren't available
-        mock_insights = [
-            {
-                'id': f'mock-{i}',
-                'insight': f'Sample insight {i}: This is a mock insight for testing the interface.',
-                'results': f'Mock results for insight {i}',
-                'limitations_context': f'Mock limitations for insight {i}',
-                'difference_score': 0.8,
-                'status': 'Not Tested',
-                'status_details': {'total_combinations': 0}
-            }
-            for i in range(1, min(limit + 1, 6))  # Show up to 5 mock insights
-        ]
-        
-        return jsonify({
-            'insights': mock_insights,
-            'total_count': 5,
-            'page': page,
-            'limit': limit,
-            'total_pages': 1,
-            'note': 'Showing mock data - pipeline dependencies not available'
+            'total_pages': (total_count + limit - 1) // limit,
+            'next_cursor': next_cursor
         })
-        
+    
     except Exception as e:
-        print(f"Error in get_insights: {str(e)}")
+        logger.error("Error in get_insights: %s", e)
         
         # Return mock data on any error
-        mock_insights = [
-            {
-                'id': 'error-mock',
-                'insight': 'Unable to connect to database. This is mock data for testing.',
-                'results': 'Database connection error',
-                'limitations_context': 'Cannot access real data',
-                'difference_score': 0,
-                'status': 'Error',
-                'status_details': {'total_combinations': 0}
-            }
-        ]
-        
         return jsonify({
-            'insights': mock_insights,
+            'insights': [ERROR_MOCK_INSIGHT],
             'total_count': 1,
             'page': page,
             'limit': limit,
@@ -197,59 +569,144 @@ def get_insights():
             'error': f'Database error: {str(e)}'
         })
 
+@app.route('/api/insights/stream')
+def stream_insights():
+    """
+    Stream insights as newline-delimited JSON in descending id order, in keyset-paginated chunks.
+    A failure mid-stream ends it with a final {"error": ...} line.
+    """
+    if not DATABASE_AVAILABLE:
+        return jsonify({'error': 'Database dependencies not available'}), 503
+    
+    after_id = _cursor_arg()
+    
+    try:
+        client = get_supabase_admin_client()
+    except Exception as e:
+        logger.error("Error connecting to Supabase: %s", e)
+        return jsonify({'error': f'Database error: {str(e)}'}), 500
+    
+    def generate(after_id):
+        try:
+            while True:
+                insights = _fetch_insights_page(client, INSIGHTS_STREAM_CHUNK_SIZE, after_id=after_id)
+                for insight in insights:
+                    yield app.json.dumps(insight) + '\n'
+                
+                if len(insights) < INSIGHTS_STREAM_CHUNK_SIZE:
+                    break
+                after_id = insights[-1]['id']
+        except Exception as e:
+            logger.error("Error streaming insights: %s", e)
+            # Let the client tell a truncated stream from a complete one
+            yield app.json.dumps({'error': str(e)}) + '\n'
+    
+    return Response(generate(after_id), mimetype='application/x-ndjson')
+
+@app.route('/api/insights/<insight_id>/full')
+def get_insight_full(insight_id):
+    """Get every column of a single insight, including the heavy text fields."""
+    if not DATABASE_AVAILABLE:
+        return jsonify({'error': 'Database dependencies not available'}), 503
+    
+    try:
+        result = get_supabase_admin_client().table('insights').select('*').eq('id', insight_id).limit(1).execute()
+        
+        if not result.data:
+            return jsonify({'error': 'Insight not found'}), 404
+        
+        return jsonify({'insight': result.data[0]})
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/products')
+@cache_json(seconds=60)
 def get_products():
     """Get all available products."""
+    if 'products' in _reference_snapshot:
+        return jsonify({'products': _reference_snapshot['products']})
+    
+    if not DATABASE_AVAILABLE:
+        # Return default products if dependencies aren't available
+        return app.response_class(_DEFAULT_PRODUCTS_BYTES, mimetype='application/json')
+    
     try:
-        from supabase import create_client
-        from utils.config import Config
-        
-        # Create client directly
-        client = create_client(Config.SUPABASE_URL, Config.SUPABASE_SERVICE_ROLE_KEY)
-        result = client.table('products').select('*').execute()
-        
-        products = [p['name'] for p in result.data] if result.data else []
+        products = _ttl_cache('products', REFERENCE_DATA_TTL, _load_products)
         return jsonify({'products': products})
-        
-    except ImportError as e:
-        # Return default products if dependencies aren't available
-        default_products = ['Facebook Ads', 'Google Ads', 'TikTok Ads', 'LinkedIn Ads']
-        return jsonify({'products': default_products, 'note': 'Using default products'})
+    
     except Exception as e:
         # Return default products on error
-        default_products = ['Facebook Ads', 'Google Ads', 'TikTok Ads', 'LinkedIn Ads']
-        return jsonify({'products': default_products, 'error': f'Database error: {str(e)}'})
+        return jsonify({'products': DEFAULT_PRODUCTS, 'error': f'Database error: {str(e)}'})
 
 @app.route('/api/regions')
+@cache_json(seconds=60)
 def get_regions():
     """Get all available regions."""
+    if 'regions' in _reference_snapshot:
+        return jsonify({'regions': _reference_snapshot['regions']})
+    
+    if not DATABASE_AVAILABLE:
+        # Return default regions if dependencies aren't available
+        return app.response_class(_DEFAULT_REGIONS_BYTES, mimetype='application/json')
+    
     try:
-        from supabase import create_client
-        from utils.config import Config
-        
-        # Create client directly
-        client = create_client(Config.SUPABASE_URL, Config.SUPABASE_SERVICE_ROLE_KEY)
-        result = client.table('regions').select('*').execute()
-        
-        regions = [r['code'] for r in result.data] if result.data else []
+        regions = _ttl_cache('regions', REFERENCE_DATA_TTL, _load_regions)
         return jsonify({'regions': regions})
-        
-    except ImportError as e:
-        # Return default regions if dependencies aren't available
-        default_regions = ['US', 'EU', 'APAC', 'LATAM', 'MENA', 'CA', 'UK', 'AU']
-        return jsonify({'regions': default_regions, 'note': 'Using default regions'})
+    
     except Exception as e:
         # Return default regions on error
-        default_regions = ['US', 'EU', 'APAC', 'LATAM', 'MENA', 'CA', 'UK', 'AU']
-        return jsonify({'regions': default_regions, 'error': f'Database error: {str(e)}'})
+        return jsonify({'regions': DEFAULT_REGIONS, 'error': f'Database error: {str(e)}'})
+
+@app.route('/api/reference/refresh', methods=['POST'])
+def refresh_reference():
+    """Reload products and regions from Supabase and rewrite the bundled snapshot."""
+    admin_token = os.environ.get('ADMIN_TOKEN')
+    if not admin_token or not hmac.compare_digest(request.headers.get('X-Admin-Token', ''), admin_token):
+        return jsonify({'error': 'Forbidden'}), 403
+    
+    if not DATABASE_AVAILABLE:
+        return jsonify({'error': 'Database dependencies not available'}), 503
+    
+    try:
+        snapshot = {
+            'products': _load_products(),
+            'regions': _load_regions()
+        }
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    
+    # Like scripts/dump_reference.py, never replace the snapshot with empty lists
+    if not snapshot['products'] or not snapshot['regions']:
+        return jsonify({'error': 'No products or regions returned; keeping the existing snapshot'}), 502
+    
+    expires = time.monotonic() + REFERENCE_DATA_TTL
+    with _cache_lock:
+        _cache['products'] = (expires, snapshot['products'])
+        _cache['regions'] = (expires, snapshot['regions'])
+    
+    _reference_snapshot.clear()
+    _reference_snapshot.update(snapshot)
+    
+    try:
+        _write_reference_snapshot(snapshot)
+    except OSError as e:
+        # Serverless filesystems are read-only; the in-memory snapshot still applies
+        logger.warning("Could not write reference snapshot: %s", e)
+    
+    return jsonify({
+        'message': 'Reference data refreshed',
+        'products': len(snapshot['products']),
+        'regions': len(snapshot['regions'])
+    })
 
 @app.route('/api/insights/<insight_id>/status', methods=['POST'])
 def update_insight_status(insight_id):
     """Move insight to testing status."""
+    if not DATABASE_AVAILABLE:
+        return jsonify({'error': 'Database dependencies not available'}), 503
+    
     try:
-        from supabase_storage.supabase_client import get_supabase_admin_client
-        from supabase_storage.insight_inserter import move_insight_to_testing
-        
         data = request.get_json()
         product_name = data.get('product_name')
         region_code = data.get('region_code')
@@ -263,34 +720,27 @@ def update_insight_status(insight_id):
         
         client = get_supabase_admin_client()
         
-        # Check for existing status record to prevent conflicts when adding new
-        existing_status = client.table('status').select('*').eq('insight_id', insight_id).eq('product_name', product_name).eq('region_code', region_code).execute()
-        
-        # If this is a new status (not editing), check for conflicts
-        if not existing_status.data:
-            # This is a new status record - check if it would create a conflict
-            # For now, we allow multiple statuses per product/region combination
-            pass
-        
         # Map frontend status to backend status (use the actual enum values)
         backend_status = 'whitelist' if status == 'whitelist' else 'blacklist'
         
         success = move_insight_to_testing(client, insight_id, product_name, region_code, backend_status)
+        _clear_page_cache()
         
         if success:
             return jsonify({'message': 'Status updated successfully'})
         else:
             return jsonify({'error': 'Failed to update status'}), 500
-            
+    
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/insights/<insight_id>/status-details')
 def get_insight_status_details(insight_id):
     """Get detailed status information for an insight."""
+    if not DATABASE_AVAILABLE:
+        return jsonify({'error': 'Database dependencies not available'}), 503
+    
     try:
-        from deduplication.supabase_lookup import get_insight_status_summary
-        
         status_summary = get_insight_status_summary(insight_id)
         
         # Transform the data for frontend display
@@ -309,7 +759,7 @@ def get_insight_status_details(insight_id):
             'details': details,
             'summary': status_summary['status_breakdown']
         })
-        
+    
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 